@@ -9,6 +9,9 @@ FIXES:
 - Validation functions updated
 """
 
+import math
+from types import MappingProxyType
+
 # ============================================================================
 # PERFORMANCE SETTINGS
 # ============================================================================
@@ -29,6 +32,7 @@ TABLET_CUSTOM_DIR = "assets/tablet_images/custom"
 
 # Logging
 LOG_LEVEL = "WARNING"  # Change to "INFO" for debugging
+LOG_BATCH_WINDOW = 1.0  # Repeated controller errors are summarized once per window (s)
 
 # Cache timeouts
 JOINT_ANGLE_CACHE_TIMEOUT = 0.5  # Cache angles for 500ms
@@ -42,9 +46,28 @@ BASE_LINEAR_SPEED_DEFAULT = 0.5     # m/s (not used in step mode)
 BASE_ANGULAR_SPEED_DEFAULT = 0.7    # rad/s (not used in step mode)
 BODY_SPEED_DEFAULT = 0.3            # For angleInterpolationWithSpeed
 
+# Continuous (hold-to-move) update rate used by the GUI
+BASE_UPDATE_HZ = 20
+UPDATE_INTERVAL = 1.0 / BASE_UPDATE_HZ              # seconds
+UPDATE_INTERVAL_MS = 1000 // BASE_UPDATE_HZ         # for QTimer
+VELOCITY_RAMP = 0.3         # Fraction of the gap to target closed per tick
+VELOCITY_RAMP_KEEP = 1.0 - VELOCITY_RAMP  # Fraction of the old velocity kept per tick
+# Ramp time constant (s) giving VELOCITY_RAMP per nominal tick; the ramp is
+# scaled by the measured tick interval so it feels the same at any tick rate
+VELOCITY_RAMP_TAU = (-UPDATE_INTERVAL / math.log(VELOCITY_RAMP_KEEP)
+                     if 0.0 < VELOCITY_RAMP_KEEP < 1.0 else 0.0)
+VELOCITY_MAX_TICK_GAP = 0.25  # Longer gaps (stalls, resume from idle) use one nominal tick
+VELOCITY_DEAD_ZONE = 0.01   # Snap to target when this close
+VELOCITY_SEND_EPSILON = 0.005   # Skip moveToward if velocity changed less than this
+VELOCITY_RESEND_INTERVAL = 0.5  # ...unless this many seconds passed (keepalive)
+VELOCITY_MIN_INTERVAL = 0.04   # Never send moveToward more often than this (s)
+
 SPEED_STEP = 0.05  # Step size adjustment increment
 MIN_SPEED = 0.05   # Minimum step size
 MAX_SPEED = 0.5    # Maximum step size
+ANGULAR_SPEED_STEP = 0.1   # Rotation step adjustment increment (rad, ~6°)
+MIN_ANGULAR_SPEED = 0.1    # Minimum rotation step (rad)
+MAX_ANGULAR_SPEED = 1.57   # Maximum rotation step (rad, 90°)
 TURBO_MULTIPLIER = 1.5  # Turbo boost
 
 # ============================================================================
@@ -147,98 +170,101 @@ BATTERY_WARNING_THRESHOLD = 30
 BATTERY_CRITICAL_THRESHOLD = 15
 STATUS_UPDATE_INTERVAL = 1000  # ms (1 second)
 
+# Joint name -> (min, max), built once at import. Read-only view.
+_JOINT_LIMITS = MappingProxyType({
+    'HeadYaw': (HEAD_YAW_MIN, HEAD_YAW_MAX),
+    'HeadPitch': (HEAD_PITCH_MIN, HEAD_PITCH_MAX),
+    'LShoulderPitch': (SHOULDER_PITCH_MIN, SHOULDER_PITCH_MAX),
+    'RShoulderPitch': (SHOULDER_PITCH_MIN, SHOULDER_PITCH_MAX),
+    'LShoulderRoll': (L_SHOULDER_ROLL_MIN, L_SHOULDER_ROLL_MAX),
+    'RShoulderRoll': (R_SHOULDER_ROLL_MIN, R_SHOULDER_ROLL_MAX),
+    'LElbowYaw': (ELBOW_YAW_MIN, ELBOW_YAW_MAX),
+    'RElbowYaw': (ELBOW_YAW_MIN, ELBOW_YAW_MAX),
+    'LElbowRoll': (L_ELBOW_ROLL_MIN, L_ELBOW_ROLL_MAX),
+    'RElbowRoll': (R_ELBOW_ROLL_MIN, R_ELBOW_ROLL_MAX),
+    'LWristYaw': (WRIST_YAW_MIN, WRIST_YAW_MAX),
+    'RWristYaw': (WRIST_YAW_MIN, WRIST_YAW_MAX),
+    'LHand': (HAND_MIN, HAND_MAX),
+    'RHand': (HAND_MIN, HAND_MAX),
+    'HipPitch': (HIP_PITCH_MIN, HIP_PITCH_MAX),
+    'KneePitch': (KNEE_PITCH_MIN, KNEE_PITCH_MAX),
+})
+
 # ============================================================================
 # HELPER FUNCTIONS
 # ============================================================================
 
 def clamp(value, min_val, max_val):
     """Clamp value between min and max."""
-    return max(min_val, min(max_val, value))
+    return min_val if value < min_val else (max_val if value > max_val else value)
 
 
 def clamp_joint(joint_name, value):
     """Clamp joint angle to safe limits."""
-    limits = {
-        'HeadYaw': (HEAD_YAW_MIN, HEAD_YAW_MAX),
-        'HeadPitch': (HEAD_PITCH_MIN, HEAD_PITCH_MAX),
-        'LShoulderPitch': (SHOULDER_PITCH_MIN, SHOULDER_PITCH_MAX),
-        'RShoulderPitch': (SHOULDER_PITCH_MIN, SHOULDER_PITCH_MAX),
-        'LShoulderRoll': (L_SHOULDER_ROLL_MIN, L_SHOULDER_ROLL_MAX),
-        'RShoulderRoll': (R_SHOULDER_ROLL_MIN, R_SHOULDER_ROLL_MAX),
-        'LElbowYaw': (ELBOW_YAW_MIN, ELBOW_YAW_MAX),
-        'RElbowYaw': (ELBOW_YAW_MIN, ELBOW_YAW_MAX),
-        'LElbowRoll': (L_ELBOW_ROLL_MIN, L_ELBOW_ROLL_MAX),
-        'RElbowRoll': (R_ELBOW_ROLL_MIN, R_ELBOW_ROLL_MAX),
-        'LWristYaw': (WRIST_YAW_MIN, WRIST_YAW_MAX),
-        'RWristYaw': (WRIST_YAW_MIN, WRIST_YAW_MAX),
-        'LHand': (HAND_MIN, HAND_MAX),
-        'RHand': (HAND_MIN, HAND_MAX),
-        'HipPitch': (HIP_PITCH_MIN, HIP_PITCH_MAX),
-        'KneePitch': (KNEE_PITCH_MIN, KNEE_PITCH_MAX),
-    }
+    limits = _JOINT_LIMITS.get(joint_name)
+    if limits is None:
+        return value
     
-    if joint_name in limits:
-        min_val, max_val = limits[joint_name]
-        return clamp(value, min_val, max_val)
-    
-    return value
+    min_val, max_val = limits
+    return min_val if value < min_val else (max_val if value > max_val else value)
+
+
+def clamp_joints(joint_names, values):
+    """Clamp a batch of joint angles in one pass (parallel name/value lists)."""
+    limits_get = _JOINT_LIMITS.get
+    clamped = []
+    for joint_name, value in zip(joint_names, values):
+        limits = limits_get(joint_name)
+        if limits is not None:
+            min_val, max_val = limits
+            value = min_val if value < min_val else (max_val if value > max_val else value)
+        clamped.append(value)
+    return clamped
 
 
 def get_joint_limits(joint_name):
     """Get min/max limits for a joint."""
-    limits_map = {
-        'HeadYaw': (HEAD_YAW_MIN, HEAD_YAW_MAX),
-        'HeadPitch': (HEAD_PITCH_MIN, HEAD_PITCH_MAX),
-        'LShoulderPitch': (SHOULDER_PITCH_MIN, SHOULDER_PITCH_MAX),
-        'RShoulderPitch': (SHOULDER_PITCH_MIN, SHOULDER_PITCH_MAX),
-        'LShoulderRoll': (L_SHOULDER_ROLL_MIN, L_SHOULDER_ROLL_MAX),
-        'RShoulderRoll': (R_SHOULDER_ROLL_MIN, R_SHOULDER_ROLL_MAX),
-        'LElbowYaw': (ELBOW_YAW_MIN, ELBOW_YAW_MAX),
-        'RElbowYaw': (ELBOW_YAW_MIN, ELBOW_YAW_MAX),
-        'LElbowRoll': (L_ELBOW_ROLL_MIN, L_ELBOW_ROLL_MAX),
-        'RElbowRoll': (R_ELBOW_ROLL_MIN, R_ELBOW_ROLL_MAX),
-        'LWristYaw': (WRIST_YAW_MIN, WRIST_YAW_MAX),
-        'RWristYaw': (WRIST_YAW_MIN, WRIST_YAW_MAX),
-        'LHand': (HAND_MIN, HAND_MAX),
-        'RHand': (HAND_MIN, HAND_MAX),
-        'HipPitch': (HIP_PITCH_MIN, HIP_PITCH_MAX),
-        'KneePitch': (KNEE_PITCH_MIN, KNEE_PITCH_MAX),
-    }
-    
-    return limits_map.get(joint_name, (0.0, 0.0))
+    return _JOINT_LIMITS.get(joint_name, (0.0, 0.0))
 
 
 # ============================================================================
 # VALIDATION
 # ============================================================================
 
-def validate_config():
-    """Validate configuration values."""
-    errors = []
-    
+# (check, error message) - checks are evaluated lazily by validate_config()
+_RULES = (
     # Speed checks
-    if MIN_SPEED >= MAX_SPEED:
-        errors.append("MIN_SPEED must be less than MAX_SPEED")
-    
-    if not (0.0 < BODY_SPEED_DEFAULT <= 1.0):
-        errors.append("BODY_SPEED_DEFAULT must be between 0 and 1")
-    
+    (lambda: MIN_SPEED < MAX_SPEED, "MIN_SPEED must be less than MAX_SPEED"),
+    (lambda: MIN_ANGULAR_SPEED < MAX_ANGULAR_SPEED,
+     "MIN_ANGULAR_SPEED must be less than MAX_ANGULAR_SPEED"),
+    (lambda: 0.0 < BODY_SPEED_DEFAULT <= 1.0, "BODY_SPEED_DEFAULT must be between 0 and 1"),
     # Step size checks
-    if LINEAR_STEP <= 0:
-        errors.append("LINEAR_STEP must be positive")
-    
-    if ANGULAR_STEP <= 0:
-        errors.append("ANGULAR_STEP must be positive")
-    
-    if VIDEO_FPS <= 0:
-        errors.append("VIDEO_FPS must be positive")
-    
-    # Joint limit checks
-    if HEAD_YAW_MIN >= HEAD_YAW_MAX:
-        errors.append("HEAD_YAW_MIN must be less than HEAD_YAW_MAX")
+    (lambda: LINEAR_STEP > 0, "LINEAR_STEP must be positive"),
+    (lambda: ANGULAR_STEP > 0, "ANGULAR_STEP must be positive"),
+    (lambda: VIDEO_FPS > 0, "VIDEO_FPS must be positive"),
+    # Continuous movement checks
+    (lambda: 0 < BASE_UPDATE_HZ <= 1000, "BASE_UPDATE_HZ must be between 1 and 1000"),
+    (lambda: 0.0 < VELOCITY_RAMP <= 1.0, "VELOCITY_RAMP must be between 0 and 1"),
+    (lambda: VELOCITY_MAX_TICK_GAP > UPDATE_INTERVAL,
+     "VELOCITY_MAX_TICK_GAP must be longer than one update interval"),
+    (lambda: VELOCITY_SEND_EPSILON < VELOCITY_DEAD_ZONE,
+     "VELOCITY_SEND_EPSILON must be less than VELOCITY_DEAD_ZONE"),
+    (lambda: VELOCITY_RESEND_INTERVAL > 0, "VELOCITY_RESEND_INTERVAL must be positive"),
+    (lambda: 0 <= VELOCITY_MIN_INTERVAL < VELOCITY_RESEND_INTERVAL,
+     "VELOCITY_MIN_INTERVAL must be between 0 and VELOCITY_RESEND_INTERVAL"),
+)
+
+
+def validate_config():
+    """Validate configuration values."""
+    errors = [message for check, message in _RULES if not check()]
     
-    if HEAD_PITCH_MIN >= HEAD_PITCH_MAX:
-        errors.append("HEAD_PITCH_MIN must be less than HEAD_PITCH_MAX")
+    # Joint limit checks (every entry in the limit table)
+    errors.extend(
+        f"{joint} min must be less than max"
+        for joint, (min_val, max_val) in _JOINT_LIMITS.items()
+        if min_val >= max_val
+    )
     
     # Report errors
     if errors:
@@ -247,10 +273,11 @@ def validate_config():
     return True
 
 
-# Run validation on import
-try:
-    validate_config()
-except ValueError as e:
-    import logging
-    logging.error(f"Config validation failed: {e}")
-    raise
\ No newline at end of file
+# Run validation on import (skipped under python -O)
+if __debug__:
+    try:
+        validate_config()
+    except ValueError as e:
+        import logging
+        logging.error(f"Config validation failed: {e}")
+        raise
\ No newline at end of file
@@ -6,16 +6,35 @@ Modules:
 - base_controller: Base movement (wheels)
 - body_controller: Arms, head, hands control
 - video_controller: Video feed display
+
+Controllers are resolved lazily on first attribute access so that
+importing the package does not pull in OpenCV/NumPy (video) or NAOqi
+until the caller actually needs them.
 """
 
-from .pepper_connection import PepperConnection
-from .base_controller import BaseController
-from .body_controller import BodyController
-from .video_controller import VideoController
+import importlib
+
+_LAZY_EXPORTS = {
+    'PepperConnection': '.pepper_connection',
+    'BaseController': '.base_controller',
+    'BodyController': '.body_controller',
+    'VideoController': '.video_controller',
+}
 
 __all__ = [
     'PepperConnection',
     'BaseController',
     'BodyController',
     'VideoController'
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    """Import controller modules on first use (PEP 562)."""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
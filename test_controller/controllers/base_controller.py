@@ -8,34 +8,168 @@ IMPROVEMENTS:
 - Async execution for non-blocking
 - Better error handling
 - Cleaner state management
+- Lightweight hold-to-move mode for the GUI (set_continuous_velocity /
+  move_continuous), ticked by a Qt timer at BASE_UPDATE_HZ
 """
 
 import logging
+import math
 import threading
+import time
+from collections import namedtuple
 from concurrent.futures import ThreadPoolExecutor
 from .. import config
 
 logger = logging.getLogger(__name__)
 
+def _dedupe_key(arg):
+    """Cheap identity for a log argument: exceptions compare by type + args, not str()."""
+    if isinstance(arg, BaseException):
+        try:
+            hash(arg.args)
+            return (type(arg), arg.args)
+        except TypeError:
+            return (type(arg), repr(arg.args))
+    return arg
+
+
+class _BatchedLog:
+    """
+    Coalesce repeated log messages. The first occurrence of a message is
+    logged immediately; repeats within the window are only counted and
+    summarized once per window, so an error storm (e.g. NAOqi unreachable
+    while a key is held) logs one line per message with a repeat count
+    instead of one per tick.
+    """
+    
+    def __init__(self, log, window):
+        self._log = log
+        self._window = window
+        self._pending = {}  # key -> [repeat count, args of first occurrence]
+        self._lock = threading.Lock()
+        self._timer = None
+    
+    def error(self, msg, *args):
+        """Log an error now, or count it if it was already logged this window."""
+        key = (msg,) + tuple(_dedupe_key(arg) for arg in args)
+        with self._lock:
+            entry = self._pending.get(key)
+            first = entry is None
+            if first:
+                self._pending[key] = [0, args]
+            else:
+                entry[0] += 1
+            timer = self._reserve_timer()
+        
+        # Log and start the flush thread outside the lock
+        if first:
+            self._log.error(msg, *args)
+        self._start(timer)
+    
+    def flush(self):
+        """Summarize the repeats counted since the last flush."""
+        with self._lock:
+            pending = self._pending
+            self._timer = None
+            
+            # Messages still repeating stay known, so the next occurrence is
+            # counted into the next summary instead of logged on its own
+            self._pending = {key: [0, args] for key, (n, args) in pending.items() if n}
+            timer = self._reserve_timer() if self._pending else None
+        
+        self._start(timer)
+        
+        for key, (n, args) in pending.items():
+            if n:
+                self._log.error(key[0] + " (repeated x%d in last %.0fs)", *args, n, self._window)
+    
+    def _reserve_timer(self):
+        """Create the flush timer if none is pending (caller holds the lock)."""
+        if self._timer is not None:
+            return None
+        self._timer = threading.Timer(self._window, self.flush)
+        self._timer.daemon = True
+        return self._timer
+    
+    @staticmethod
+    def _start(timer):
+        """Start a reserved timer (outside the lock)."""
+        if timer is not None:
+            timer.start()
+
+
+_error_log = _BatchedLog(logger, config.LOG_BATCH_WINDOW)
+
+# Snapshot returned by BaseController.get_state()
+BaseState = namedtuple(
+    'BaseState',
+    'linear_step angular_step turbo emergency_stopped is_moving velocity'
+)
+
 class BaseController:
     """Simple, reliable step-based movement controller."""
     
+    # Fixed attribute layout: the 20 Hz hold-to-move tick reads many of these
+    __slots__ = (
+        'motion', '_move_to', '_move_toward', '_stop_move',
+        'linear_speed', 'angular_speed', '_effective_linear', '_effective_angular',
+        'linear_step', 'angular_step',
+        '_turbo_enabled', '_emergency_stopped', '_moving',
+        '_lock', '_executor', '_pending_movement',
+        '_target',
+        'base_x', 'base_y', 'base_theta', '_was_moving',
+        '_last_sent', '_last_send_time',
+        '_velocity_cmd', '_velocity_event', '_velocity_thread', '_closed', '_stop_gen',
+        '_state_gen', '_state_cache',
+        '_speed_step', '_min_speed', '_max_speed',
+        '_angular_speed_step', '_min_angular_speed', '_max_angular_speed',
+        '_turbo_multiplier', '_velocity_ramp', '_velocity_keep', '_ramp_tau', '_max_tick_gap',
+        '_last_tick', '_dead_zone',
+        '_send_epsilon_sq', '_resend_interval', '_min_send_interval',
+    )
+    
+    # direction -> unit (x, y, theta), scaled by the current step sizes
+    _DIRECTIONS = {
+        'forward': (1.0, 0.0, 0.0),
+        'back': (-1.0, 0.0, 0.0),
+        'left': (0.0, 1.0, 0.0),
+        'right': (0.0, -1.0, 0.0),
+        'rotate_left': (0.0, 0.0, 1.0),
+        'rotate_right': (0.0, 0.0, -1.0),
+    }
+    
+    # hold-to-move axis -> index into the (x, y, theta) target tuple
+    _AXES = {'x': 0, 'y': 1, 'theta': 2}
+    
     def __init__(self, motion_service):
         self.motion = motion_service
         
-        # Speed settings
+        # Bound NAOqi calls used on the movement paths
+        self._move_to = motion_service.moveTo
+        self._move_toward = motion_service.moveToward
+        self._stop_move = motion_service.stopMove
+        
+        # Speed settings (change them through set_speed / toggle_turbo)
         self.linear_speed = config.BASE_LINEAR_SPEED_DEFAULT
         self.angular_speed = config.BASE_ANGULAR_SPEED_DEFAULT
+        self._turbo_enabled = False
         
         # Current step sizes
         self.linear_step = config.LINEAR_STEP  # 0.1m = 10cm
         self.angular_step = config.ANGULAR_STEP  # 0.3 rad ≈ 17°
         
+        # Tuning constants, bound once (see _bind_config)
+        self._bind_config()
+        
         # State
-        self._turbo_enabled = False
         self._emergency_stopped = False
         self._moving = False
         
+        # get_state() cache: writers bump _state_gen *after* changing state,
+        # readers reuse the cached snapshot while the generation is unchanged
+        self._state_gen = 0
+        self._state_cache = None
+        
         # Thread safety
         self._lock = threading.Lock()
         
@@ -45,8 +179,37 @@ class BaseController:
             thread_name_prefix="BaseMove"
         )
         
-        # Movement queue to prevent spam
+        # Not-yet-sent step displacement (x, y, theta); presses made while a
+        # step is executing are composed here and sent as one moveTo
         self._pending_movement = None
+        
+        # Continuous (hold-to-move) state used by the GUI:
+        # targets are set on press/release, velocities ramp toward them
+        # (x, y, theta) target, swapped as one tuple so the tick reads a
+        # consistent snapshot without locking
+        self._target = (0.0, 0.0, 0.0)
+        self.base_x = 0.0
+        self.base_y = 0.0
+        self.base_theta = 0.0
+        self._was_moving = False
+        self._last_tick = 0.0
+        
+        # Last velocity handed to moveToward (skip near-duplicate RPCs)
+        self._last_sent = (0.0, 0.0, 0.0)
+        self._last_send_time = 0.0
+        
+        # Velocity commands go to one dedicated worker through a single
+        # latest-command slot: newer commands overwrite unsent ones
+        self._velocity_cmd = None
+        self._stop_gen = 0  # Bumped by every stop; tags velocity commands
+        self._velocity_event = threading.Event()
+        self._closed = False
+        self._velocity_thread = threading.Thread(
+            target=self._velocity_loop,
+            name="BaseVelocity",
+            daemon=True
+        )
+        self._velocity_thread.start()
     
     # ========================================================================
     # MOVEMENT - Simple step-based system
@@ -55,7 +218,8 @@ class BaseController:
     def move_step(self, direction):
         """
         Move one step in the given direction.
-        Non-blocking, queues movement if one is already executing.
+        Non-blocking; presses made while a step is executing are composed
+        into a single follow-up moveTo to the same end pose.
         
         Args:
             direction: 'forward', 'back', 'left', 'right', 
@@ -66,57 +230,244 @@ class BaseController:
             return False
         
         # Calculate movement parameters
-        x, y, theta = 0.0, 0.0, 0.0
-        
-        if direction == 'forward':
-            x = self.linear_step
-        elif direction == 'back':
-            x = -self.linear_step
-        elif direction == 'left':
-            y = self.linear_step
-        elif direction == 'right':
-            y = -self.linear_step
-        elif direction == 'rotate_left':
-            theta = self.angular_step
-        elif direction == 'rotate_right':
-            theta = -self.angular_step
-        else:
-            logger.warning(f"Unknown direction: {direction}")
+        unit = self._DIRECTIONS.get(direction)
+        if unit is None:
+            logger.warning("Unknown direction: %s", direction)
             return False
         
-        # Apply turbo multiplier
+        # Scale once (turbo included), then apply to the unit vector
+        linear = self.linear_step
+        angular = self.angular_step
         if self._turbo_enabled:
-            x *= config.TURBO_MULTIPLIER
-            y *= config.TURBO_MULTIPLIER
-            theta *= config.TURBO_MULTIPLIER
+            turbo = self._turbo_multiplier
+            linear *= turbo
+            angular *= turbo
+        
+        ux, uy, utheta = unit
+        x = ux * linear
+        y = uy * linear
+        theta = utheta * angular
         
-        # Submit async (non-blocking)
-        self._executor.submit(self._execute_movement, x, y, theta, direction)
+        with self._lock:
+            pending = self._pending_movement
+            if pending is None:
+                self._pending_movement = (x, y, theta)
+            else:
+                # moveTo offsets are relative poses: the new step starts from
+                # the pending step's end pose, so rotate its translation into
+                # that heading before adding (plain sums would use the old one)
+                px, py, ptheta = pending
+                if ptheta:
+                    cos_t, sin_t = math.cos(ptheta), math.sin(ptheta)
+                    x, y = cos_t * x - sin_t * y, sin_t * x + cos_t * y
+                self._pending_movement = (px + x, py + y, ptheta + theta)
+        
+        # Submit async (non-blocking); one queued job drains everything pending
+        if pending is None:
+            self._executor.submit(self._execute_movement)
         return True
     
-    def _execute_movement(self, x, y, theta, direction):
+    def _execute_movement(self):
         """
-        Internal method to execute movement.
+        Internal method to execute the pending (coalesced) movement.
         Runs in thread pool, doesn't block caller.
         """
         with self._lock:
-            if self._emergency_stopped:
+            movement = self._pending_movement
+            self._pending_movement = None
+            if movement is None or self._emergency_stopped or self._closed:
                 return
             
             self._moving = True
+            self._state_gen += 1
         
+        x, y, theta = movement
         try:
             # Execute moveTo with speed control
             # moveTo is blocking, but we're in a thread so it's fine
-            self.motion.moveTo(x, y, theta)
+            self._move_to(x, y, theta)
             
-            logger.debug(f"Moved {direction}: ({x:.2f}, {y:.2f}, {theta:.2f})")
+            logger.debug("Moved (%.2f, %.2f, %.2f)", x, y, theta)
             
         except Exception as e:
-            logger.error(f"Movement failed: {e}")
+            _error_log.error("Movement failed: %s", e)
         finally:
             with self._lock:
                 self._moving = False
+                self._state_gen += 1
+    
+    # ========================================================================
+    # MOVEMENT - Continuous (hold-to-move, GUI)
+    # ========================================================================
+    
+    def set_continuous_velocity(self, axis, value):
+        """
+        Set the hold-to-move target for one axis.
+        
+        Args:
+            axis: 'x', 'y' or 'theta'
+            value: -1.0 to 1.0, scaled by the current speed (0.0 = released)
+        """
+        if self._emergency_stopped:
+            return False
+        
+        index = self._AXES.get(axis)
+        if index is None:
+            logger.warning("Unknown axis: %s", axis)
+            return False
+        
+        if value:
+            speed = self._effective_angular if index == 2 else self._effective_linear
+            
+            # moveToward takes normalized velocities
+            target = value * speed
+            target = -1.0 if target < -1.0 else (1.0 if target > 1.0 else target)
+        else:
+            target = 0.0  # Release: nothing to scale
+        
+        # Key-repeat re-sends the same value; skip the lock when nothing changes.
+        # Comparing the scaled target (not the raw value) keeps speed changes
+        # and _clear_continuous() from being masked by a stale cache
+        if self._target[index] == target:
+            return True
+        
+        # Writers lock the read-modify-write; the tick reads lock-free
+        with self._lock:
+            targets = list(self._target)
+            targets[index] = target
+            self._target = tuple(targets)
+        
+        return True
+    
+    def move_continuous(self):
+        """
+        Advance hold-to-move by one tick (called at BASE_UPDATE_HZ).
+        Ramps velocities toward their targets and sends them with moveToward.
+        """
+        # Read before any state: a command built from pre-stop state always
+        # carries a pre-stop generation, so the worker can tell it is stale
+        stop_gen = self._stop_gen
+        
+        if self._emergency_stopped:
+            return
+        
+        # Reads are lock-free: the target tuple is swapped atomically (one
+        # attribute store under the GIL) and the velocities are only written
+        # by this tick and by stop(). The write-back at the end takes the
+        # lock and re-checks stop_gen, so a stop() from another thread that
+        # lands mid-tick is never overwritten by this tick's stale result.
+        tx, ty, tt = self._target
+        bx, by, btheta = self.base_x, self.base_y, self.base_theta
+        
+        # Idle fast path: nothing requested, nothing ramping, stop already sent
+        if not (tx or ty or tt or bx or by or btheta or self._was_moving):
+            return
+        
+        now = time.monotonic()
+        dt = now - self._last_tick
+        self._last_tick = now
+        
+        # Framerate-independent ramp: scale by the measured tick interval,
+        # but fall back to one nominal tick when starting from rest or after
+        # a stall (so a long gap can't jump straight to the target)
+        if (bx or by or btheta) and dt < self._max_tick_gap and self._ramp_tau:
+            keep = math.exp(-dt / self._ramp_tau)
+            ramp = 1.0 - keep
+        else:
+            ramp = self._velocity_ramp
+            keep = self._velocity_keep
+        dead_zone = self._dead_zone
+        
+        # Exponential ramp: v = v * (1 - ramp) + target * ramp
+        x = bx * keep + tx * ramp
+        y = by * keep + ty * ramp
+        theta = btheta * keep + tt * ramp
+        
+        # Snap onto the target once close enough (lands exactly on 0.0)
+        if abs(tx - x) < dead_zone:
+            x = tx
+        if abs(ty - y) < dead_zone:
+            y = ty
+        if abs(tt - theta) < dead_zone:
+            theta = tt
+        
+        moving = bool(x or y or theta)
+        
+        with self._lock:
+            # A stop landed mid-tick: its cleared state wins
+            if stop_gen != self._stop_gen or self._emergency_stopped:
+                return
+            
+            self.base_x, self.base_y, self.base_theta = x, y, theta
+            
+            if moving:
+                # NAOqi keeps the last moveToward active, so only send when the
+                # velocity actually changed (plus a periodic keepalive), at most
+                # once per VELOCITY_MIN_INTERVAL however fast we are ticked.
+                # Starting to move always goes out immediately.
+                lx, ly, ltheta = self._last_sent
+                dx, dy, dtheta = x - lx, y - ly, theta - ltheta
+                elapsed = now - self._last_send_time
+                if not self._was_moving or (
+                        elapsed >= self._min_send_interval
+                        and (dx * dx + dy * dy + dtheta * dtheta >= self._send_epsilon_sq
+                             or elapsed >= self._resend_interval)):
+                    self._last_sent = (x, y, theta)
+                    self._last_send_time = now
+                    self._send_velocity(x, y, theta, stop_gen)
+            elif self._was_moving:
+                self._last_sent = (0.0, 0.0, 0.0)
+                self._send_velocity(0.0, 0.0, 0.0, stop_gen)
+            
+            self._was_moving = moving
+            self._state_gen += 1
+    
+    def _send_velocity(self, x, y, theta, stop_gen):
+        """Hand a velocity command to the velocity worker (never blocks)."""
+        self._velocity_cmd = (x, y, theta, stop_gen)
+        self._velocity_event.set()
+    
+    def _velocity_loop(self):
+        """Velocity worker: send the most recent command, drop stale ones."""
+        while True:
+            self._velocity_event.wait()
+            self._velocity_event.clear()
+            
+            if self._closed:
+                return
+            
+            cmd = self._velocity_cmd
+            self._velocity_cmd = None
+            if cmd is not None:
+                self._execute_velocity(*cmd)
+    
+    def _execute_velocity(self, x, y, theta, stop_gen):
+        """Send a velocity command (runs on the velocity worker)."""
+        # Built before a stop()/emergency_stop(): drop it
+        if self._emergency_stopped or self._closed or stop_gen != self._stop_gen:
+            return
+        
+        try:
+            if x or y or theta:
+                self._move_toward(x, y, theta)
+                
+                # A stop that landed while moveToward was in flight may have
+                # reached the robot first; moveToward keeps driving until
+                # stopped, so follow it with a stop of our own
+                if stop_gen != self._stop_gen or self._emergency_stopped:
+                    self._stop_move()
+                    logger.debug("Stopped a velocity command overtaken by stop")
+            else:
+                self._stop_move()
+        except Exception as e:
+            _error_log.error("Velocity command failed: %s", e)
+            
+            # Only commands that reached the robot count as sent: force the
+            # next tick to resend (a failed stop is retried the same way)
+            self._last_send_time = 0.0
+            if not (x or y or theta):
+                self._was_moving = True
+                self._state_gen += 1
     
     # ========================================================================
     # CONTROL
@@ -126,30 +477,55 @@ class BaseController:
         """Stop all movement immediately (blocking for safety)."""
         with self._lock:
             self._moving = False
+            self._pending_movement = None
+            self._clear_continuous()
         
         try:
-            self.motion.stopMove()
+            self._stop_move()
             logger.debug("Movement stopped")
         except Exception as e:
-            logger.error(f"Stop failed: {e}")
+            _error_log.error("Stop failed: %s", e)
     
     def emergency_stop(self):
-        """Emergency stop - highest priority."""
+        """Emergency stop - highest priority (robot first, bookkeeping after)."""
+        # Lock-free: every dispatch path checks this flag before sending
         self._emergency_stopped = True
-        
-        with self._lock:
-            self._moving = False
+        self._stop_gen += 1  # Invalidate velocity commands already built
+        self._velocity_cmd = None  # Drop any unsent velocity command
         
         try:
-            self.motion.stopMove()
+            self._stop_move()
             self.motion.killMove()  # Force kill
             logger.error("🚨 EMERGENCY STOP")
         except Exception as e:
-            logger.error(f"Emergency stop error: {e}")
+            logger.error("Emergency stop error: %s", e)
+        
+        with self._lock:
+            self._moving = False
+            self._pending_movement = None
+            self._clear_continuous()
+    
+    def _clear_continuous(self):
+        """Zero hold-to-move targets and velocities (caller holds the lock)."""
+        self._target = (0.0, 0.0, 0.0)
+        self.base_x = self.base_y = self.base_theta = 0.0
+        self._was_moving = False
+        self._last_sent = (0.0, 0.0, 0.0)
+        self._velocity_cmd = None  # Drop any unsent command
+        self._stop_gen += 1  # ...and any the worker has already taken
+        self._state_gen += 1
+    
+    def reset_position(self):
+        """
+        Mark the current pose as the new origin (GUI reset button).
+        Steps are relative moveTo calls, so no position is tracked to clear.
+        """
+        logger.info("✓ Position reset")
     
     def resume_from_emergency(self):
         """Resume from emergency stop."""
         self._emergency_stopped = False
+        self._state_gen += 1
         logger.info("✓ Emergency cleared")
     
     # ========================================================================
@@ -159,67 +535,131 @@ class BaseController:
     def increase_speed(self):
         """Increase step size."""
         with self._lock:
-            self.linear_step = min(
-                self.linear_step + 0.05,  # 5cm increments
-                0.5  # Max 50cm per step
-            )
-            self.angular_step = min(
-                self.angular_step + 0.1,  # ~6° increments
-                1.57  # Max 90° per step
-            )
-            step = self.linear_step
-        
-        logger.info(f"⬆️ Step size: {step:.2f}m")
-        return step
+            linear = min(self.linear_step + self._speed_step, self._max_speed)
+            angular = min(self.angular_step + self._angular_speed_step, self._max_angular_speed)
+            changed = linear != self.linear_step or angular != self.angular_step
+            if changed:
+                self.linear_step = linear
+                self.angular_step = angular
+                self._state_gen += 1
+        
+        if changed:
+            logger.info("⬆️ Step size: %.2fm", linear)
+        else:
+            logger.debug("Step size already at maximum (%.2fm)", linear)
+        return linear
     
     def decrease_speed(self):
         """Decrease step size."""
         with self._lock:
-            self.linear_step = max(
-                self.linear_step - 0.05,
-                0.05  # Min 5cm per step
-            )
-            self.angular_step = max(
-                self.angular_step - 0.1,
-                0.1  # Min ~6° per step
-            )
-            step = self.linear_step
-        
-        logger.info(f"⬇️ Step size: {step:.2f}m")
-        return step
+            linear = max(self.linear_step - self._speed_step, self._min_speed)
+            angular = max(self.angular_step - self._angular_speed_step, self._min_angular_speed)
+            changed = linear != self.linear_step or angular != self.angular_step
+            if changed:
+                self.linear_step = linear
+                self.angular_step = angular
+                self._state_gen += 1
+        
+        if changed:
+            logger.info("⬇️ Step size: %.2fm", linear)
+        else:
+            logger.debug("Step size already at minimum (%.2fm)", linear)
+        return linear
+    
+    def set_speed(self, linear, angular):
+        """Set hold-to-move linear/angular speeds (GUI speed slider)."""
+        with self._lock:
+            self.linear_speed = linear
+            self.angular_speed = angular
+            self._update_effective_speeds()
+            self._state_gen += 1
     
     def toggle_turbo(self):
         """Toggle turbo mode."""
-        self._turbo_enabled = not self._turbo_enabled
+        with self._lock:
+            self._turbo_enabled = enabled = not self._turbo_enabled
+            self._update_effective_speeds()
+            self._state_gen += 1
         
-        status = "ENABLED 🚀" if self._turbo_enabled else "DISABLED"
-        logger.info(f"Turbo: {status}")
+        logger.info("Turbo: %s", "ENABLED 🚀" if enabled else "DISABLED")
         
-        return self._turbo_enabled
+        return enabled
+    
+    def _update_effective_speeds(self):
+        """Precompute turbo-scaled speeds so readers need a single attribute load."""
+        turbo = self._turbo_multiplier if self._turbo_enabled else 1.0
+        self._effective_linear = self.linear_speed * turbo
+        self._effective_angular = self.angular_speed * turbo
+    
+    def _bind_config(self):
+        """Bind tuning constants from config (construction only)."""
+        self._speed_step = config.SPEED_STEP
+        self._min_speed = config.MIN_SPEED
+        self._max_speed = config.MAX_SPEED
+        self._angular_speed_step = config.ANGULAR_SPEED_STEP
+        self._min_angular_speed = config.MIN_ANGULAR_SPEED
+        self._max_angular_speed = config.MAX_ANGULAR_SPEED
+        self._turbo_multiplier = config.TURBO_MULTIPLIER
+        self._velocity_ramp = config.VELOCITY_RAMP
+        self._velocity_keep = config.VELOCITY_RAMP_KEEP
+        self._ramp_tau = config.VELOCITY_RAMP_TAU
+        self._max_tick_gap = config.VELOCITY_MAX_TICK_GAP
+        self._dead_zone = config.VELOCITY_DEAD_ZONE
+        self._send_epsilon_sq = config.VELOCITY_SEND_EPSILON ** 2
+        self._resend_interval = config.VELOCITY_RESEND_INTERVAL
+        self._min_send_interval = config.VELOCITY_MIN_INTERVAL
+        self._update_effective_speeds()
     
     # ========================================================================
     # STATUS
     # ========================================================================
     
     def is_moving(self):
-        """Check if currently executing a movement."""
-        with self._lock:
-            return self._moving
+        """Check if currently executing a step or hold-to-move movement."""
+        # Lock-free: two flag reads, each atomic under the GIL
+        return self._moving or self._was_moving
     
     def get_state(self):
-        """Get current state."""
-        with self._lock:
-            return {
-                'linear_step': self.linear_step,
-                'angular_step': self.angular_step,
-                'turbo': self._turbo_enabled,
-                'emergency_stopped': self._emergency_stopped,
-                'is_moving': self._moving
-            }
+        """Get current state as a BaseState (use ._asdict() for a dict)."""
+        gen = self._state_gen
+        cached = self._state_cache
+        if cached is not None and cached[0] == gen:
+            return cached[1]
+        
+        # Lock-free: per-field reads are GIL-atomic. Only coupled writes
+        # (the step-size pair) take the lock, and they bump the generation
+        # afterwards, so a half-updated read is returned once but never cached.
+        state = BaseState(
+            self.linear_step,
+            self.angular_step,
+            self._turbo_enabled,
+            self._emergency_stopped,
+            self._moving or self._was_moving,
+            (self.base_x, self.base_y, self.base_theta)
+        )
+        
+        # Only cache if nothing changed while we were reading
+        if self._state_gen == gen:
+            self._state_cache = (gen, state)
+        return state
     
     def cleanup(self):
         """Cleanup resources."""
         logger.info("Cleaning up base controller...")
-        self.stop()
-        self._executor.shutdown(wait=False)
+        
+        # Close first: queued work sees the flag and returns without an RPC
+        self._closed = True
+        self.stop()  # Also interrupts an in-flight moveTo
+        
+        self._velocity_event.set()
+        self._velocity_thread.join(timeout=2.0)
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        
+        # Nothing can be sent after this point; make sure the base is still
+        try:
+            self._stop_move()
+        except Exception as e:
+            _error_log.error("Stop failed: %s", e)
+        
+        _error_log.flush()
         logger.info("✓ Base controller cleaned up")
\ No newline at end of file
@@ -12,11 +12,80 @@ IMPROVEMENTS:
 
 import logging
 import threading
+import time
 from concurrent.futures import ThreadPoolExecutor
 from .. import config
 
 logger = logging.getLogger(__name__)
 
+# Joints driven by relative steps; their targets are cached locally
+JOINTS = (
+    "HeadYaw", "HeadPitch",
+    "LShoulderPitch", "RShoulderPitch",
+    "LShoulderRoll", "RShoulderRoll",
+    "LElbowRoll", "RElbowRoll",
+    "LWristYaw", "RWristYaw",
+)
+_JOINT_LIST = list(JOINTS)  # getAngles wants a list
+
+def _step_table(joint, label, signs):
+    """
+    Build a (side, direction) -> (group, sign, min, max, description) table.
+    
+    Joint names, limits and log labels are resolved once at import time
+    so a keypress costs one dict lookup.
+    """
+    table = {}
+    for (side, direction), sign in signs.items():
+        joint_name = side + joint
+        min_val, max_val = config.get_joint_limits(joint_name)
+        table[side, direction] = (
+            (joint_name,), sign, min_val, max_val, f"{side} {label} {direction}"
+        )
+    return table
+
+
+# Head: direction -> (index into (yaw, pitch), sign, min, max, description)
+_HEAD_JOINTS = ("HeadYaw", "HeadPitch")
+_HEAD_STEPS = {
+    'left': (0, 1, config.HEAD_YAW_MIN, config.HEAD_YAW_MAX, "Head left"),
+    'right': (0, -1, config.HEAD_YAW_MIN, config.HEAD_YAW_MAX, "Head right"),
+    'up': (1, -1, config.HEAD_PITCH_MIN, config.HEAD_PITCH_MAX, "Head up"),
+    'down': (1, 1, config.HEAD_PITCH_MIN, config.HEAD_PITCH_MAX, "Head down"),
+}
+
+# Negative = up for shoulder pitch
+_SHOULDER_PITCH_STEPS = _step_table("ShoulderPitch", "shoulder", {
+    ('L', 'up'): -1, ('L', 'down'): 1,
+    ('R', 'up'): -1, ('R', 'down'): 1,
+})
+
+# Left arm: positive = out, Right arm: negative = out
+_SHOULDER_ROLL_STEPS = _step_table("ShoulderRoll", "arm", {
+    ('L', 'out'): 1, ('L', 'in'): -1,
+    ('R', 'out'): -1, ('R', 'in'): 1,
+})
+
+# Left: negative = bend, Right: positive = bend
+_ELBOW_ROLL_STEPS = _step_table("ElbowRoll", "elbow", {
+    ('L', 'bend'): -1, ('L', 'straighten'): 1,
+    ('R', 'bend'): 1, ('R', 'straighten'): -1,
+})
+
+_WRIST_YAW_STEPS = _step_table("WristYaw", "wrist", {
+    ('L', 'cw'): 1, ('L', 'ccw'): -1,
+    ('R', 'cw'): 1, ('R', 'ccw'): -1,
+})
+
+# angleInterpolationWithSpeed fraction of max joint speed
+_BODY_SPEED_STEP = 0.1
+_BODY_SPEED_MIN = 0.1
+_BODY_SPEED_MAX = 1.0
+
+_HAND_JOINTS = {'L': ("LHand",), 'R': ("RHand",)}
+_HAND_OPEN = {'L': "L hand open", 'R': "R hand open"}
+_HAND_CLOSE = {'L': "L hand close", 'R': "R hand close"}
+
 class BodyController:
     """Controls head, arms, and hands with step-based movements."""
     
@@ -34,9 +103,25 @@ class BodyController:
         # State
         self._emergency_stopped = False
         
-        # Thread safety
+        # Settings snapshot for get_state(), replaced whole under the lock
+        self._state_snapshot = (self.body_speed, self.head_step, self.arm_step)
+        
+        # Thread safety (writers only; readers use the snapshot / atomic loads)
         self._lock = threading.Lock()
         
+        # Latest target per joint group, waiting for its worker.
+        # Key-repeat overwrites the slot instead of queueing another RPC.
+        self._pending_moves = {}
+        self._moves_queued = 0  # Bumped per queued move; lets refreshes detect races
+        
+        # Last commanded angle per joint. Steps build on this instead of a
+        # getAngles round-trip per keypress; when idle and older than the
+        # timeout, all joints are re-read in one batched call.
+        self._joint_cache = {}
+        self._cache_time = 0.0
+        self._cache_timeout = config.JOINT_ANGLE_CACHE_TIMEOUT
+        self.refresh_joint_cache()
+        
         # Async executor (allows multiple body parts to move simultaneously)
         self._executor = ThreadPoolExecutor(
             max_workers=4,  # Can move head + both arms at once
@@ -57,42 +142,26 @@ class BodyController:
         if self._emergency_stopped:
             return False
         
-        # Get current angles (cached where possible)
+        step = _HEAD_STEPS.get(direction)
+        if step is None:
+            logger.warning("Unknown head direction: %s", direction)
+            return False
+        
+        index, sign, min_val, max_val, description = step
+        
+        # Start from the last commanded angles
         try:
-            current_yaw = self.motion.getAngles("HeadYaw", True)[0]
-            current_pitch = self.motion.getAngles("HeadPitch", True)[0]
+            angles = [self._get_angle("HeadYaw"), self._get_angle("HeadPitch")]
         except:
             logger.warning("Could not get current head angles")
             return False
         
-        # Calculate new angles
-        new_yaw = current_yaw
-        new_pitch = current_pitch
-        
-        if direction == 'left':
-            new_yaw = current_yaw + self.head_step
-        elif direction == 'right':
-            new_yaw = current_yaw - self.head_step
-        elif direction == 'up':
-            new_pitch = current_pitch - self.head_step
-        elif direction == 'down':
-            new_pitch = current_pitch + self.head_step
-        else:
-            logger.warning(f"Unknown head direction: {direction}")
-            return False
+        # Only the stepped axis can leave its limits
+        angle = angles[index] + sign * self.head_step
+        angles[index] = min_val if angle < min_val else (max_val if angle > max_val else angle)
         
-        # Clamp to limits
-        new_yaw = config.clamp(new_yaw, config.HEAD_YAW_MIN, config.HEAD_YAW_MAX)
-        new_pitch = config.clamp(new_pitch, config.HEAD_PITCH_MIN, config.HEAD_PITCH_MAX)
-        
-        # Execute async
-        self._executor.submit(
-            self._move_joints_smooth,
-            ["HeadYaw", "HeadPitch"],
-            [new_yaw, new_pitch],
-            self.body_speed,
-            f"Head {direction}"
-        )
+        # Execute async (coalesced per joint group)
+        self._queue_move(_HEAD_JOINTS, angles, description)
         
         return True
     
@@ -101,18 +170,12 @@ class BodyController:
         if self._emergency_stopped:
             return False
         
-        self._executor.submit(
-            self._move_joints_smooth,
-            ["HeadYaw", "HeadPitch"],
-            [0.0, 0.0],
-            self.body_speed,
-            "Head reset"
-        )
+        self._queue_move(_HEAD_JOINTS, [0.0, 0.0], "Head reset")
         
         return True
     
     # ========================================================================
-    # SHOULDER CONTROL (Pitch)
+    # ARM CONTROL
     # ========================================================================
     
     def move_shoulder_pitch(self, side, direction):
@@ -123,46 +186,7 @@ class BodyController:
             side: 'L' or 'R'
             direction: 'up' or 'down'
         """
-        if self._emergency_stopped:
-            return False
-        
-        joint = f"{side}ShoulderPitch"
-        
-        try:
-            current = self.motion.getAngles(joint, True)[0]
-        except:
-            logger.warning(f"Could not get {joint} angle")
-            return False
-        
-        # Calculate new angle (negative = up for shoulder pitch)
-        if direction == 'up':
-            new_angle = current - self.arm_step
-        elif direction == 'down':
-            new_angle = current + self.arm_step
-        else:
-            return False
-        
-        # Clamp
-        new_angle = config.clamp(
-            new_angle,
-            config.SHOULDER_PITCH_MIN,
-            config.SHOULDER_PITCH_MAX
-        )
-        
-        # Execute async
-        self._executor.submit(
-            self._move_joints_smooth,
-            [joint],
-            [new_angle],
-            self.body_speed,
-            f"{side} shoulder {direction}"
-        )
-        
-        return True
-    
-    # ========================================================================
-    # SHOULDER CONTROL (Roll - out/in)
-    # ========================================================================
+        return self._step_joint(_SHOULDER_PITCH_STEPS, side, direction, self.arm_step)
     
     def move_shoulder_roll(self, side, direction):
         """
@@ -172,45 +196,7 @@ class BodyController:
             side: 'L' or 'R'
             direction: 'out' or 'in'
         """
-        if self._emergency_stopped:
-            return False
-        
-        joint = f"{side}ShoulderRoll"
-        
-        try:
-            current = self.motion.getAngles(joint, True)[0]
-        except:
-            return False
-        
-        # Calculate new angle
-        if direction == 'out':
-            # Left arm: positive = out, Right arm: negative = out
-            new_angle = current + self.arm_step if side == 'L' else current - self.arm_step
-        elif direction == 'in':
-            new_angle = current - self.arm_step if side == 'L' else current + self.arm_step
-        else:
-            return False
-        
-        # Clamp to side-specific limits
-        if side == 'L':
-            new_angle = config.clamp(new_angle, config.L_SHOULDER_ROLL_MIN, config.L_SHOULDER_ROLL_MAX)
-        else:
-            new_angle = config.clamp(new_angle, config.R_SHOULDER_ROLL_MIN, config.R_SHOULDER_ROLL_MAX)
-        
-        # Execute async
-        self._executor.submit(
-            self._move_joints_smooth,
-            [joint],
-            [new_angle],
-            self.body_speed,
-            f"{side} arm {direction}"
-        )
-        
-        return True
-    
-    # ========================================================================
-    # ELBOW CONTROL
-    # ========================================================================
+        return self._step_joint(_SHOULDER_ROLL_STEPS, side, direction, self.arm_step)
     
     def move_elbow_roll(self, side, direction):
         """
@@ -220,41 +206,7 @@ class BodyController:
             side: 'L' or 'R'
             direction: 'bend' or 'straighten'
         """
-        if self._emergency_stopped:
-            return False
-        
-        joint = f"{side}ElbowRoll"
-        
-        try:
-            current = self.motion.getAngles(joint, True)[0]
-        except:
-            return False
-        
-        # Calculate new angle
-        if direction == 'bend':
-            # Left: negative = bend, Right: positive = bend
-            new_angle = current - self.arm_step if side == 'L' else current + self.arm_step
-        elif direction == 'straighten':
-            new_angle = current + self.arm_step if side == 'L' else current - self.arm_step
-        else:
-            return False
-        
-        # Clamp
-        if side == 'L':
-            new_angle = config.clamp(new_angle, config.L_ELBOW_ROLL_MIN, config.L_ELBOW_ROLL_MAX)
-        else:
-            new_angle = config.clamp(new_angle, config.R_ELBOW_ROLL_MIN, config.R_ELBOW_ROLL_MAX)
-        
-        # Execute async
-        self._executor.submit(
-            self._move_joints_smooth,
-            [joint],
-            [new_angle],
-            self.body_speed,
-            f"{side} elbow {direction}"
-        )
-        
-        return True
+        return self._step_joint(_ELBOW_ROLL_STEPS, side, direction, self.arm_step)
     
     # ========================================================================
     # WRIST CONTROL
@@ -268,37 +220,7 @@ class BodyController:
             side: 'L' or 'R'
             direction: 'cw' (clockwise) or 'ccw' (counter-clockwise)
         """
-        if self._emergency_stopped:
-            return False
-        
-        joint = f"{side}WristYaw"
-        
-        try:
-            current = self.motion.getAngles(joint, True)[0]
-        except:
-            return False
-        
-        # Calculate new angle
-        if direction == 'cw':
-            new_angle = current + self.wrist_step
-        elif direction == 'ccw':
-            new_angle = current - self.wrist_step
-        else:
-            return False
-        
-        # Clamp
-        new_angle = config.clamp(new_angle, config.WRIST_YAW_MIN, config.WRIST_YAW_MAX)
-        
-        # Execute async
-        self._executor.submit(
-            self._move_joints_smooth,
-            [joint],
-            [new_angle],
-            self.body_speed,
-            f"{side} wrist {direction}"
-        )
-        
-        return True
+        return self._step_joint(_WRIST_YAW_STEPS, side, direction, self.wrist_step)
     
     # ========================================================================
     # HAND CONTROL
@@ -315,19 +237,18 @@ class BodyController:
         if self._emergency_stopped:
             return False
         
-        joint = f"{side}Hand"
+        group = _HAND_JOINTS.get(side)
+        if group is None:
+            return False
         
         # Hand is 0.0 = closed, 1.0 = open
-        target = 1.0 if action == 'open' else 0.0
-        
-        # Execute async
-        self._executor.submit(
-            self._move_joints_smooth,
-            [joint],
-            [target],
-            self.body_speed,
-            f"{side} hand {action}"
-        )
+        if action == 'open':
+            target, description = 1.0, _HAND_OPEN[side]
+        else:
+            target, description = 0.0, _HAND_CLOSE[side]
+        
+        # Execute async (coalesced per joint group)
+        self._queue_move(group, [target], description)
         
         return True
     
@@ -337,26 +258,138 @@ class BodyController:
     
     def increase_speed(self):
         """Increase body movement speed."""
-        with self._lock:
-            self.body_speed = min(self.body_speed + 0.1, 1.0)
-            speed = self.body_speed
-        
-        logger.info(f"⬆️ Body speed: {speed:.2f}")
-        return speed
+        return self._adjust_speed(_BODY_SPEED_STEP)
     
     def decrease_speed(self):
         """Decrease body movement speed."""
+        return self._adjust_speed(-_BODY_SPEED_STEP)
+    
+    def _adjust_speed(self, delta):
+        """Shift body_speed by delta within [_BODY_SPEED_MIN, _BODY_SPEED_MAX]."""
         with self._lock:
-            self.body_speed = max(self.body_speed - 0.1, 0.1)
-            speed = self.body_speed
+            speed = self.body_speed + delta
+            speed = _BODY_SPEED_MIN if speed < _BODY_SPEED_MIN else (
+                _BODY_SPEED_MAX if speed > _BODY_SPEED_MAX else speed)
+            self.body_speed = speed
+            self._state_snapshot = (speed, self.head_step, self.arm_step)
         
-        logger.info(f"⬇️ Body speed: {speed:.2f}")
+        logger.info("%s Body speed: %.2f", "⬆️" if delta > 0 else "⬇️", speed)
         return speed
     
     # ========================================================================
     # INTERNAL METHODS
     # ========================================================================
     
+    def _step_joint(self, steps, side, direction, step):
+        """Step one arm/wrist joint using its precomputed dispatch entry."""
+        if self._emergency_stopped:
+            return False
+        
+        entry = steps.get((side, direction))
+        if entry is None:
+            return False
+        
+        group, sign, min_val, max_val, description = entry
+        
+        try:
+            current = self._get_angle(group[0])
+        except:
+            logger.warning("Could not get %s angle", group[0])
+            return False
+        
+        new_angle = current + sign * step
+        new_angle = min_val if new_angle < min_val else (max_val if new_angle > max_val else new_angle)
+        
+        # Execute async (coalesced per joint group)
+        self._queue_move(group, [new_angle], description)
+        
+        return True
+    
+    def refresh_joint_cache(self):
+        """
+        Re-read every stepped joint from the robot in one getAngles call.
+        
+        Joints with a move queued or running keep their commanded
+        target, since the sensors lag behind it.
+        
+        Returns:
+            True if the robot answered
+        """
+        # Stamp first so concurrent callers don't pile up on the RPC
+        self._cache_time = time.monotonic()
+        queued = self._moves_queued
+        
+        try:
+            angles = self.motion.getAngles(_JOINT_LIST, True)
+        except Exception as e:
+            logger.warning("Could not read joint angles: %s", e)
+            return False
+        
+        with self._lock:
+            # A move queued during the read may already be finished; the
+            # reading predates it, so leave the cache alone this time
+            if self._moves_queued != queued:
+                return False
+            
+            busy = set()
+            for group in self._pending_moves:
+                busy.update(group)
+            
+            cache = self._joint_cache
+            for joint_name, angle in zip(JOINTS, angles):
+                if joint_name not in busy:
+                    cache[joint_name] = angle
+        
+        return True
+    
+    def _get_angle(self, joint_name):
+        """Last commanded angle for a joint, read from the robot on a cache miss."""
+        # Pick up motions made outside this controller (dances, posture)
+        # once the cached targets have settled
+        if (not self._pending_moves
+                and time.monotonic() - self._cache_time > self._cache_timeout):
+            self.refresh_joint_cache()
+        
+        angle = self._joint_cache.get(joint_name)
+        if angle is None:
+            angle = self.motion.getAngles(joint_name, True)[0]
+            self._joint_cache[joint_name] = angle
+        return angle
+    
+    def _queue_move(self, joint_names, angles, description=""):
+        """
+        Queue a move for a joint group, replacing any move still waiting.
+        
+        Only one task per group runs at a time; it drains the slot until
+        empty, so a held key sends the newest target instead of a backlog.
+        """
+        with self._lock:
+            # Record the target now so the next step builds on it
+            self._joint_cache.update(zip(joint_names, angles))
+            self._moves_queued += 1
+            
+            idle = joint_names not in self._pending_moves
+            self._pending_moves[joint_names] = (angles, self.body_speed, description)
+        
+        if idle:
+            self._executor.submit(self._drain_moves, joint_names)
+    
+    def _drain_moves(self, joint_names):
+        """Run the newest queued move for a joint group until none is left."""
+        while True:
+            with self._lock:
+                move = self._pending_moves.get(joint_names)
+                if move is None:
+                    # Removing the key marks the group idle again
+                    self._pending_moves.pop(joint_names, None)
+                    return
+                
+                # Leave the key in place (as None) while the RPC runs
+                self._pending_moves[joint_names] = None
+            
+            angles, speed, description = move
+            self._move_joints_smooth(list(joint_names), angles, speed, description)
+    
     def _move_joints_smooth(self, joint_names, angles, speed, description=""):
         """
         Internal method to move joints smoothly.
@@ -382,30 +415,49 @@ class BodyController:
                 )
             
             if description:
-                logger.debug(f"Body: {description}")
+                logger.debug("Body: %s", description)
         
         except Exception as e:
-            logger.error(f"Body movement error: {e}")
+            logger.error("Body movement error: %s", e)
+            
+            # The joints never reached the cached target; re-read next time
+            for joint_name in joint_names:
+                self._joint_cache.pop(joint_name, None)
     
     def emergency_stop(self):
-        """Emergency stop."""
+        """Emergency stop - flag first, then halt interpolations already running."""
+        # Lock-free: queued moves check this flag before sending
         self._emergency_stopped = True
-        logger.error("🚨 EMERGENCY STOP - Body")
+        
+        try:
+            self.motion.killAll()
+            logger.error("🚨 EMERGENCY STOP - Body")
+        except Exception as e:
+            logger.error("Body emergency stop error: %s", e)
     
     def resume_from_emergency(self):
         """Resume from emergency."""
+        # Targets queued during the stop were never sent
+        self._joint_cache.clear()
+        self._cache_time = 0.0
         self._emergency_stopped = False
         logger.info("✓ Emergency cleared - Body")
     
     def get_state(self):
-        """Get current state."""
-        with self._lock:
-            return {
-                'body_speed': self.body_speed,
-                'head_step': self.head_step,
-                'arm_step': self.arm_step,
-                'emergency_stopped': self._emergency_stopped
-            }
+        """
+        Get current state.
+        
+        Lock-free: the settings come from one immutable tuple swapped in by
+        writers, so they are always mutually consistent. The emergency flag
+        is read live so emergency_stop() never has to touch the snapshot.
+        """
+        body_speed, head_step, arm_step = self._state_snapshot
+        return {
+            'body_speed': body_speed,
+            'head_step': head_step,
+            'arm_step': arm_step,
+            'emergency_stopped': self._emergency_stopped
+        }
     
     def cleanup(self):
         """Cleanup resources."""
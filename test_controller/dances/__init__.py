@@ -7,18 +7,39 @@ Modules:
 - twerk_dance: Enhanced twerk with squat motion
 - robot_dance: Mechanical robot-style dance
 - moonwalk_dance: Michael Jackson moonwalk sequence
+- registry: Lazy dance_id -> dance mapping
+
+Dances are resolved lazily on first attribute access, so building the
+registry does not import every dance module.
 """
 
-from .base_dance import BaseDance
-from .wave_dance import WaveDance
-from .special_dance import SpecialDance
-from .robot_dance import RobotDance
-from .moonwalk_dance import MoonwalkDance
+import importlib
+
+_LAZY_EXPORTS = {
+    'BaseDance': '.base_dance',
+    'WaveDance': '.wave_dance',
+    'SpecialDance': '.special_dance',
+    'RobotDance': '.robot_dance',
+    'MoonwalkDance': '.moonwalk_dance',
+    'DanceRegistry': '.registry',
+}
 
 __all__ = [
     'BaseDance',
     'WaveDance',
     'SpecialDance',
     'RobotDance',
-    'MoonwalkDance'
-]
\ No newline at end of file
+    'MoonwalkDance',
+    'DanceRegistry'
+]
+
+
+def __getattr__(name):
+    """Import dance modules on first use (PEP 562)."""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
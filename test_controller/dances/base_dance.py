@@ -50,22 +50,44 @@ class BaseDance:
             joint_names = [joint_names]
             angles = [angles]
         
-        # Clamp all angles to safe limits
-        clamped_angles = []
-        for joint_name, angle in zip(joint_names, angles):
-            clamped = config.clamp_joint(joint_name, angle)
+        clamped_angles = self._clamp_angles(joint_names, angles)
+        
+        try:
+            self.motion.setAngles(joint_names, clamped_angles, speed)
             
-            # Warn if clamping occurred
-            if abs(clamped - angle) > 0.01:
-                logger.warning(f"{joint_name}: Requested {angle:.2f} → Clamped to {clamped:.2f}")
+            if description:
+                logger.debug("Dance move: %s", description)
+            
+            return True
             
-            clamped_angles.append(clamped)
+        except Exception as e:
+            logger.error(f"Failed to set angles: {e}")
+            return False
+    
+    def safe_set_angles_smooth(self, joint_names, angles, speed, description=""):
+        """
+        Blocking variant of safe_set_angles using angleInterpolationWithSpeed.
+        Returns True if successful, False if aborted.
+        """
+        if self.should_abort():
+            logger.warning("Dance aborted during move")
+            return False
+        
+        if isinstance(joint_names, str):
+            joint_names = [joint_names]
+            angles = [angles]
+        
+        clamped_angles = self._clamp_angles(joint_names, angles)
         
         try:
-            self.motion.setAngles(joint_names, clamped_angles, speed)
+            # Single joints are passed as scalars, as NAOqi expects
+            if len(joint_names) == 1:
+                self.motion.angleInterpolationWithSpeed(joint_names[0], clamped_angles[0], speed)
+            else:
+                self.motion.angleInterpolationWithSpeed(joint_names, clamped_angles, speed)
             
             if description:
-                logger.debug(f"Dance move: {description}")
+                logger.debug("Dance move: %s", description)
             
             return True
             
@@ -73,6 +95,17 @@ class BaseDance:
             logger.error(f"Failed to set angles: {e}")
             return False
     
+    def _clamp_angles(self, joint_names, angles):
+        """Clamp angles to safe joint limits, warning when a value is changed."""
+        clamped_angles = config.clamp_joints(joint_names, angles)
+        
+        # Warn if clamping occurred
+        for joint_name, angle, clamped in zip(joint_names, angles, clamped_angles):
+            if abs(clamped - angle) > 0.01:
+                logger.warning(f"{joint_name}: Requested {angle:.2f} → Clamped to {clamped:.2f}")
+        
+        return clamped_angles
+    
     def safe_wait(self, duration):
         """
         Wait for duration, but check for abort periodically.
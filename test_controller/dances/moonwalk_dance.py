@@ -9,7 +9,6 @@ FIXED: Changed all setAngles() to angleInterpolationWithSpeed()
 import time
 import logging
 from .base_dance import BaseDance
-from .. import config
 
 logger = logging.getLogger(__name__)
 
@@ -233,32 +232,3 @@ class MoonwalkDance(BaseDance):
         logger.info("🌙 MOONWALK COMPLETE! That's how MJ did it (safely)!")
         if not self.return_to_stand(0.6):
             logger.warning("Failed to return to stand cleanly")
-    
-    def safe_set_angles_smooth(self, joint_names, angles, speed, description=""):
-        """Use angleInterpolationWithSpeed for smooth movement."""
-        if self.should_abort():
-            return False
-        
-        if isinstance(joint_names, str):
-            joint_names = [joint_names]
-            angles = [angles]
-        
-        clamped_angles = []
-        for joint_name, angle in zip(joint_names, angles):
-            clamped = config.clamp_joint(joint_name, angle)
-            if abs(clamped - angle) > 0.01:
-                logger.warning(f"{joint_name}: Clamped {angle:.2f} → {clamped:.2f}")
-            clamped_angles.append(clamped)
-        
-        try:
-            self.motion.angleInterpolationWithSpeed(
-                joint_names if len(joint_names) > 1 else joint_names[0],
-                clamped_angles if len(clamped_angles) > 1 else clamped_angles[0],
-                speed
-            )
-            if description:
-                logger.debug(f"Dance move: {description}")
-            return True
-        except Exception as e:
-            logger.error(f"Failed to set angles: {e}")
-            return False
\ No newline at end of file
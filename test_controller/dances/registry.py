@@ -0,0 +1,47 @@
+"""
+Dance Registry - lazy import and construction
+Maps dance ids to dance instances. Each dance module is imported and the
+dance constructed on first use.
+
+A typical session performs zero or one dance, so there is no reason to
+import or construct all of them at connection time.
+"""
+
+import importlib
+from collections.abc import Mapping
+
+
+class DanceRegistry(Mapping):
+    """
+    Read-only dance_id -> dance mapping that imports and constructs on
+    first lookup.
+    
+    Args:
+        dance_classes: dance_id -> (module, class name); module is relative
+                       to this package, e.g. ('.wave_dance', 'WaveDance')
+    """
+    
+    def __init__(self, motion_service, posture_service, dance_classes):
+        self.motion = motion_service
+        self.posture = posture_service
+        self._classes = dict(dance_classes)
+        self._instances = {}
+    
+    def __getitem__(self, dance_id):
+        dance = self._instances.get(dance_id)
+        if dance is None:
+            module_name, class_name = self._classes[dance_id]
+            module = importlib.import_module(module_name, __package__)
+            dance = getattr(module, class_name)(self.motion, self.posture)
+            self._instances[dance_id] = dance
+        return dance
+    
+    def __contains__(self, dance_id):
+        # Membership must not construct the dance
+        return dance_id in self._classes
+    
+    def __iter__(self):
+        return iter(self._classes)
+    
+    def __len__(self):
+        return len(self._classes)
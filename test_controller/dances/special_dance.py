@@ -17,7 +17,6 @@ Based on actual human twerk biomechanics mapped to Pepper's joints.
 import time
 import logging
 from .base_dance import BaseDance
-from .. import config
 
 logger = logging.getLogger(__name__)
 
@@ -323,32 +322,3 @@ class SpecialDance(BaseDance):
         logger.info("💃 SPECIAL DANCE COMPLETE! Pepper's got RHYTHM!")
         if not self.return_to_stand(0.7):
             logger.warning("Failed to return to stand cleanly")
-    
-    def safe_set_angles_smooth(self, joint_names, angles, speed, description=""):
-        """Use angleInterpolationWithSpeed for smooth movement."""
-        if self.should_abort():
-            return False
-        
-        if isinstance(joint_names, str):
-            joint_names = [joint_names]
-            angles = [angles]
-        
-        clamped_angles = []
-        for joint_name, angle in zip(joint_names, angles):
-            clamped = config.clamp_joint(joint_name, angle)
-            if abs(clamped - angle) > 0.01:
-                logger.warning(f"{joint_name}: Clamped {angle:.2f} → {clamped:.2f}")
-            clamped_angles.append(clamped)
-        
-        try:
-            self.motion.angleInterpolationWithSpeed(
-                joint_names if len(joint_names) > 1 else joint_names[0],
-                clamped_angles if len(clamped_angles) > 1 else clamped_angles[0],
-                speed
-            )
-            if description:
-                logger.debug(f"  {description}")
-            return True
-        except Exception as e:
-            logger.error(f"Failed to set angles: {e}")
-            return False
\ No newline at end of file
@@ -74,44 +74,3 @@ class WaveDance(BaseDance):
             logger.warning("Failed to return to stand cleanly")
         
         logger.info("✓ Wave animation complete")
-    
-    def safe_set_angles_smooth(self, joint_names, angles, speed, description=""):
-        """
-        Safely set joint angles using angleInterpolationWithSpeed (SMOOTH).
-        Returns True if successful, False if aborted.
-        """
-        if self.should_abort():
-            logger.warning("Dance aborted during move")
-            return False
-        
-        if isinstance(joint_names, str):
-            joint_names = [joint_names]
-            angles = [angles]
-        
-        # Clamp all angles to safe limits
-        clamped_angles = []
-        for joint_name, angle in zip(joint_names, angles):
-            clamped = config.clamp_joint(joint_name, angle)
-            
-            # Warn if clamping occurred
-            if abs(clamped - angle) > 0.01:
-                logger.warning(f"{joint_name}: Requested {angle:.2f} → Clamped to {clamped:.2f}")
-            
-            clamped_angles.append(clamped)
-        
-        try:
-            # FIXED: Use angleInterpolationWithSpeed for smooth movement
-            self.motion.angleInterpolationWithSpeed(
-                joint_names if len(joint_names) > 1 else joint_names[0],
-                clamped_angles if len(clamped_angles) > 1 else clamped_angles[0],
-                speed
-            )
-            
-            if description:
-                logger.debug(f"Dance move: {description}")
-            
-            return True
-            
-        except Exception as e:
-            logger.error(f"Failed to set angles: {e}")
-            return False
\ No newline at end of file
@@ -14,6 +14,7 @@ from PyQt5.QtWidgets import (
 from PyQt5.QtCore import Qt, QTimer, pyqtSignal
 from PyQt5.QtGui import QImage, QPixmap
 
+from .. import config
 from .file_handler import FileDropPanel
 from .image_manager import ImageManager
 
@@ -43,7 +44,7 @@ class CameraPanel(QWidget):
         # Frame update timer
         self.update_timer = QTimer()
         self.update_timer.timeout.connect(self._update_feeds)
-        self.update_timer.setInterval(100)  # 10 FPS
+        self.update_timer.setInterval(config.CAMERA_UPDATE_INTERVAL)
         
         self._init_ui()
     
@@ -248,7 +249,7 @@ class CameraPanel(QWidget):
                 self.pepper_label.setPixmap(scaled)
             
         except Exception as e:
-            logger.debug(f"Pepper frame update error: {e}")
+            logger.debug("Pepper frame update error: %s", e)
             if self._pepper_feed_active:
                 self.pepper_label.setText("Connection lost\nRetrying...")
     
@@ -279,7 +280,7 @@ class CameraPanel(QWidget):
                 self.hover_label.setPixmap(scaled)
             
         except Exception as e:
-            logger.debug(f"HoverCam frame update error: {e}")
+            logger.debug("HoverCam frame update error: %s", e)
             if self._hover_feed_active:
                 self.hover_label.setText("Connection lost\nRetrying...")
     
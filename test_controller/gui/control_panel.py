@@ -19,6 +19,8 @@ from PyQt5.QtWidgets import (
 )
 from PyQt5.QtCore import Qt, pyqtSignal, QTimer
 
+from .. import config
+
 logger = logging.getLogger(__name__)
 
 class ControlPanel(QWidget):
@@ -45,11 +47,12 @@ class ControlPanel(QWidget):
             'rotate_left': False,
             'rotate_right': False
         }
+        self._last_held = (0.0, 0.0, 0.0)
         
         # Movement update timer (for hold-to-move)
         self._movement_timer = QTimer()
         self._movement_timer.timeout.connect(self._update_held_movement)
-        self._movement_timer.start(50)  # 20Hz
+        self._movement_timer.start(config.UPDATE_INTERVAL_MS)
         
         self._init_ui()
     
@@ -354,35 +357,28 @@ class ControlPanel(QWidget):
             """)
     
     def _update_held_movement(self):
-        """Update movement for held buttons (called by timer at 20Hz)."""
+        """
+        Push held-button targets to the base (called by timer at BASE_UPDATE_HZ).
+        Only sends on change so keyboard hold-to-move isn't overridden, and
+        leaves move_continuous() to the main window's movement timer.
+        """
         base = self.controllers.get('base')
         if not base:
             return
         
-        # Set velocities based on active movements
-        if self._movement_active['forward']:
-            base.set_continuous_velocity('x', 1.0)
-        elif self._movement_active['back']:
-            base.set_continuous_velocity('x', -1.0)
-        else:
-            base.set_continuous_velocity('x', 0.0)
-        
-        if self._movement_active['left']:
-            base.set_continuous_velocity('y', 1.0)
-        elif self._movement_active['right']:
-            base.set_continuous_velocity('y', -1.0)
-        else:
-            base.set_continuous_velocity('y', 0.0)
-        
-        if self._movement_active['rotate_left']:
-            base.set_continuous_velocity('theta', 1.0)
-        elif self._movement_active['rotate_right']:
-            base.set_continuous_velocity('theta', -1.0)
-        else:
-            base.set_continuous_velocity('theta', 0.0)
+        active = self._movement_active
+        held = (
+            1.0 if active['forward'] else (-1.0 if active['back'] else 0.0),
+            1.0 if active['left'] else (-1.0 if active['right'] else 0.0),
+            1.0 if active['rotate_left'] else (-1.0 if active['rotate_right'] else 0.0),
+        )
+        if held == self._last_held:
+            return
         
-        # Update base movement
-        base.move_continuous()
+        self._last_held = held
+        base.set_continuous_velocity('x', held[0])
+        base.set_continuous_velocity('y', held[1])
+        base.set_continuous_velocity('theta', held[2])
     
     def _update_button_state(self, direction, pressed):
         """Update button visual state."""
@@ -446,8 +442,7 @@ class ControlPanel(QWidget):
         
         base = self.controllers.get('base')
         if base:
-            base.linear_speed = speed
-            base.angular_speed = speed * 1.5  # Angular a bit faster
+            base.set_speed(speed, speed * 1.5)  # Angular a bit faster
         
         self.status_update_signal.emit(f"Speed: {speed:.2f} m/s")
     
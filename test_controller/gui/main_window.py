@@ -23,6 +23,7 @@ from PyQt5.QtWidgets import (
 from PyQt5.QtCore import Qt, QTimer, pyqtSignal, QEvent
 from PyQt5.QtGui import QKeyEvent
 
+from .. import config
 from .styles import apply_theme
 from .camera_panel import CameraPanel
 from .control_panel import ControlPanel
@@ -50,8 +51,8 @@ class PepperControlGUI(QMainWindow):
         # Battery warning state
         self._battery_warning_shown = False
         self._battery_critical_shown = False
-        self._low_battery_threshold = 30
-        self._critical_battery_threshold = 15
+        self._low_battery_threshold = config.BATTERY_WARNING_THRESHOLD
+        self._critical_battery_threshold = config.BATTERY_CRITICAL_THRESHOLD
         
         # Keyboard state tracking
         self._keys_pressed = set()
@@ -68,12 +69,12 @@ class PepperControlGUI(QMainWindow):
         # Start status update timer
         self.status_timer = QTimer()
         self.status_timer.timeout.connect(self._update_status)
-        self.status_timer.start(1000)
+        self.status_timer.start(config.STATUS_UPDATE_INTERVAL)
         
         # Start base movement update timer
         self.movement_timer = QTimer()
         self.movement_timer.timeout.connect(self._update_movement)
-        self.movement_timer.start(50)
+        self.movement_timer.start(config.UPDATE_INTERVAL_MS)
         
         logger.info("✓ GUI initialized with keyboard shortcuts enabled")
         logger.info("  Press F1 for help, Arrow keys to move, Space to stop")
@@ -82,7 +83,7 @@ class PepperControlGUI(QMainWindow):
         """Initialize the user interface."""
         self.setWindowTitle("🤖 Pepper Control Center")
         self.setMinimumSize(800, 600)
-        self.resize(1200, 800)
+        self.resize(config.DEFAULT_WINDOW_WIDTH, config.DEFAULT_WINDOW_HEIGHT)
         
         # Create menu bar
         self._create_menu_bar()
@@ -471,17 +472,9 @@ class PepperControlGUI(QMainWindow):
         self.mode_label = QLabel("Mode: --")
         self.tablet_label = QLabel("Tablet: --")
         
+        # Styled by QLabel#statusBarLabel in the app-wide theme (parsed once)
         for label in [self.connection_label, self.battery_label, self.mode_label, self.tablet_label]:
-            label.setStyleSheet("""
-                QLabel {
-                    padding: 5px 10px;
-                    margin: 2px;
-                    background-color: #2d2d30;
-                    border-radius: 4px;
-                    color: #e0e0e0;
-                    font-size: 12px;
-                }
-            """)
+            label.setObjectName("statusBarLabel")
             self.status_bar.addPermanentWidget(label)
         
         self._update_status()
@@ -537,7 +530,7 @@ class PepperControlGUI(QMainWindow):
             logger.error(f"Status update error: {e}")
     
     def _update_movement(self):
-        """Update continuous base movement (20Hz)."""
+        """Update continuous base movement (BASE_UPDATE_HZ)."""
         try:
             base = self.controllers.get('base')
             if base:
@@ -550,11 +543,27 @@ class PepperControlGUI(QMainWindow):
         self.status_bar.showMessage(message, 3000)
     
     def _emergency_stop(self):
-        """Emergency stop."""
+        """Emergency stop (latched until the warning is acknowledged)."""
+        base = self.controllers.get('base')
+        body = self.controllers.get('body')
         try:
+            # Controllers first: drops hold-to-move targets and blocks the
+            # movement tick, so nothing re-sends moveToward after the stop
+            if base:
+                base.emergency_stop()
+            if body:
+                body.emergency_stop()
+            
             self.pepper.emergency_stop()
             self.status_bar.showMessage("🚨 EMERGENCY STOP", 5000)
             QMessageBox.warning(self, "Emergency Stop", "Emergency stop activated!")
+            
+            # The GUI has no separate resume control; dismissing the
+            # warning re-arms the controllers from a stopped state
+            if base:
+                base.resume_from_emergency()
+            if body:
+                body.resume_from_emergency()
         except Exception as e:
             logger.error(f"Emergency stop error: {e}")
     
@@ -571,7 +580,10 @@ class PepperControlGUI(QMainWindow):
                 
                 if 'window' in settings:
                     w = settings['window']
-                    self.resize(w.get('width', 1200), w.get('height', 800))
+                    self.resize(
+                        w.get('width', config.DEFAULT_WINDOW_WIDTH),
+                        w.get('height', config.DEFAULT_WINDOW_HEIGHT)
+                    )
                     self.move(w.get('x', 100), w.get('y', 100))
                 
                 if 'splitter' in settings:
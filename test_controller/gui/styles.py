@@ -33,6 +33,15 @@ QStatusBar::item {
     border: none;
 }
 
+QLabel#statusBarLabel {
+    padding: 5px 10px;
+    margin: 2px;
+    background-color: #2d2d30;
+    border-radius: 4px;
+    color: #e0e0e0;
+    font-size: 12px;
+}
+
 /* ========================================================================
    PANELS & FRAMES
    ======================================================================== */
@@ -17,6 +17,40 @@ from pynput.keyboard import Key
 
 logger = logging.getLogger(__name__)
 
+# Built once; printed with a single write
+_CONTROLS_TEXT = "\n".join([
+    "\n" + "="*60,
+    "  🎮 PEPPER KEYBOARD CONTROLS - STEP-BASED",
+    "="*60,
+    "  All movement is step-based (reliable & predictable)",
+    "  V: Video | M: Tablet | H: Greeting | P: Status",
+    "  SPACE: Stop | ESC: Emergency stop & quit",
+    "",
+    "  BASE MOVEMENT (each press = one step):",
+    "    Arrow Keys: Move | Q/E: Rotate",
+    "    +/-: Step size | X: Turbo",
+    "",
+    "  HEAD:",
+    "    W/S: Up/Down | A/D: Left/Right | R: Reset",
+    "",
+    "  ARMS:",
+    "    U/J: L shoulder | I/K: R shoulder",
+    "    O: L arm out | L: R arm out",
+    "    7/9: L elbow | 8/0: R elbow",
+    "",
+    "  WRISTS:",
+    "    ,/.: L wrist | ;/': R wrist",
+    "",
+    "  HANDS (Shift):",
+    "    </> : L hand | (/): R hand",
+    "",
+    "  DANCES:",
+    "    1: Wave | 2: Special | 3: Robot | 4: Moonwalk",
+    "",
+    "  ✨ SIMPLE, FAST, RELIABLE!",
+    "="*60 + "\n",
+])
+
 class InputHandler:
     """Simplified keyboard input handler - all step-based."""
     
@@ -261,27 +295,31 @@ class InputHandler:
             base_state = self.base.get_state()
             body_state = self.body.get_state()
             
-            print("\n" + "="*60)
-            print("🤖 PEPPER ROBOT STATUS")
-            print("="*60)
-            print(f"Battery: {status.get('battery', '?')}%")
-            print(f"Connected: {status.get('connected', False)}")
-            print()
-            print("--- BASE MOVEMENT ---")
-            print(f"Step Size: {base_state['linear_step']:.2f}m")
-            print(f"Rotation Step: {base_state['angular_step']:.2f} rad")
-            print(f"Turbo: {base_state['turbo']}")
-            print(f"Moving: {base_state['is_moving']}")
-            print()
-            print("--- BODY ---")
-            print(f"Speed: {body_state['body_speed']:.2f}")
-            print(f"Head Step: {body_state['head_step']:.2f} rad")
-            print(f"Arm Step: {body_state['arm_step']:.2f} rad")
-            print()
-            print("--- DISPLAYS ---")
-            print(f"Video: {self.video.is_active()}")
-            print(f"Tablet: {self.tablet.get_current_mode()}")
-            print("="*60 + "\n")
+            lines = [
+                "\n" + "="*60,
+                "🤖 PEPPER ROBOT STATUS",
+                "="*60,
+                f"Battery: {status.get('battery', '?')}%",
+                f"Connected: {status.get('connected', False)}",
+                "",
+                "--- BASE MOVEMENT ---",
+                f"Step Size: {base_state.linear_step:.2f}m",
+                f"Rotation Step: {base_state.angular_step:.2f} rad",
+                f"Turbo: {base_state.turbo}",
+                f"Moving: {base_state.is_moving}",
+                "",
+                "--- BODY ---",
+                f"Speed: {body_state['body_speed']:.2f}",
+                f"Head Step: {body_state['head_step']:.2f} rad",
+                f"Arm Step: {body_state['arm_step']:.2f} rad",
+                "",
+                "--- DISPLAYS ---",
+                f"Video: {self.video.is_active()}",
+                f"Tablet: {self.tablet.get_current_mode()}",
+                "="*60 + "\n",
+            ]
+            # Single write instead of one per line
+            print("\n".join(lines))
         except Exception as e:
             logger.error(f"Status error: {e}")
     
@@ -294,33 +332,4 @@ class InputHandler:
     
     def _print_controls(self):
         """Print control instructions."""
-        print("\n" + "="*60)
-        print("  🎮 PEPPER KEYBOARD CONTROLS - STEP-BASED")
-        print("="*60)
-        print("  All movement is step-based (reliable & predictable)")
-        print("  V: Video | M: Tablet | H: Greeting | P: Status")
-        print("  SPACE: Stop | ESC: Emergency stop & quit")
-        print()
-        print("  BASE MOVEMENT (each press = one step):")
-        print("    Arrow Keys: Move | Q/E: Rotate")
-        print("    +/-: Step size | X: Turbo")
-        print()
-        print("  HEAD:")
-        print("    W/S: Up/Down | A/D: Left/Right | R: Reset")
-        print()
-        print("  ARMS:")
-        print("    U/J: L shoulder | I/K: R shoulder")
-        print("    O: L arm out | L: R arm out")
-        print("    7/9: L elbow | 8/0: R elbow")
-        print()
-        print("  WRISTS:")
-        print("    ,/.: L wrist | ;/': R wrist")
-        print()
-        print("  HANDS (Shift):")
-        print("    </> : L hand | (/): R hand")
-        print()
-        print("  DANCES:")
-        print("    1: Wave | 2: Special | 3: Robot | 4: Moonwalk")
-        print()
-        print("  ✨ SIMPLE, FAST, RELIABLE!")
-        print("="*60 + "\n")
\ No newline at end of file
+        print(_CONTROLS_TEXT)
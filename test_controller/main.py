@@ -13,16 +13,74 @@ import sys
 import os
 import logging
 import argparse
+import importlib.util
+
+from . import config
 
-# Minimal logging
-logging.basicConfig(
-    level=logging.WARNING,
-    format='%(levelname)s: %(message)s'
-)
 logger = logging.getLogger(__name__)
 
-# Set important loggers to INFO
-logging.getLogger('test_controller').setLevel(logging.INFO)
+
+def _configure_logging(quiet):
+    """
+    Set up logging when run() starts, not at import time.
+    Package loggers stay at INFO (keyboard mode reports speed, turbo and
+    status through them); --quiet drops them to config.LOG_LEVEL.
+    """
+    logging.basicConfig(
+        level=logging.WARNING,
+        format='%(levelname)s: %(message)s'
+    )
+    level = config.LOG_LEVEL if quiet else logging.INFO
+    logging.getLogger('test_controller').setLevel(level)
+
+# Modules the GUI imports at load time (probed, never imported, by main)
+_GUI_DEPENDENCIES = ('PyQt5', 'cv2', 'numpy')
+
+
+def _missing_gui_dependencies():
+    """Return GUI dependencies that are not installed, without importing them."""
+    return [name for name in _GUI_DEPENDENCIES
+            if importlib.util.find_spec(name) is None]
+
+
+def _save_pepper_ip(pepper_ip):
+    """Persist the IP atomically so a partial write never leaves a bad file."""
+    tmp_path = ".pepper_ip.tmp"
+    try:
+        with open(tmp_path, "w") as f:
+            f.write(pepper_ip)
+        os.replace(tmp_path, ".pepper_ip")
+    except OSError as e:
+        logger.debug(f"Could not save Pepper IP: {e}")
+        
+        # Don't leave a half-written temp file behind
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+
+def _load_runtime():
+    """
+    Import the core controllers.
+    Deferred until an IP is known so --help and the IP prompt stay fast.
+    """
+    from .controllers.pepper_connection import PepperConnection
+    from .controllers.base_controller import BaseController
+    from .controllers.body_controller import BodyController
+    return PepperConnection, BaseController, BodyController
+
+
+def _build_dances(pepper_conn):
+    """Build the dance registry (each dance is imported and built on first use)."""
+    from .dances import DanceRegistry
+    return DanceRegistry(pepper_conn.motion, pepper_conn.posture, {
+        'wave': ('.wave_dance', 'WaveDance'),
+        'special': ('.special_dance', 'SpecialDance'),
+        'robot': ('.robot_dance', 'RobotDance'),
+        'moonwalk': ('.moonwalk_dance', 'MoonwalkDance')
+    })
+
 
 def run():
     """Main entry - simplified."""
@@ -35,22 +93,31 @@ def run():
     parser.add_argument('--gui', action='store_true', help="Launch GUI")
     parser.add_argument('--no-video', action='store_true', help="Disable video")
     parser.add_argument('--minimal', action='store_true', help="Minimal mode")
+    parser.add_argument('--quiet', '-q', action='store_true',
+                        help="Only show logs at LOG_LEVEL (config.py) and above")
     
     args = parser.parse_args()
+    _configure_logging(args.quiet)
     
     # Determine mode
     use_gui = args.gui and not args.no_gui
     enable_video = not args.no_video and not args.minimal
     minimal_mode = args.minimal
     
+    if use_gui:
+        missing = _missing_gui_dependencies()
+        if missing:
+            logger.warning(f"GUI dependencies missing ({', '.join(missing)}) - using keyboard mode")
+            use_gui = False
+    
     # Get IP
     pepper_ip = args.ip or args.ip_flag
     
-    if not pepper_ip and os.path.exists(".pepper_ip"):
+    if not pepper_ip:
         try:
-            with open(".pepper_ip", "r") as f:
+            with open(".pepper_ip", "r", errors="ignore") as f:
                 pepper_ip = f.read().strip()
-        except:
+        except OSError:
             pass
     
     if not pepper_ip:
@@ -59,11 +126,7 @@ def run():
             print("No IP provided.")
             sys.exit(1)
         
-        try:
-            with open(".pepper_ip", "w") as f:
-                f.write(pepper_ip)
-        except:
-            pass
+        _save_pepper_ip(pepper_ip)
     
     # ========================================================================
     # INITIALIZATION
@@ -76,7 +139,7 @@ def run():
     
     try:
         # Import controllers
-        from .controllers import PepperConnection, BaseController, BodyController
+        PepperConnection, BaseController, BodyController = _load_runtime()
         
         # Connect
         logger.info("Connecting to Pepper...")
@@ -90,7 +153,7 @@ def run():
         # Optional: Video controller
         video_ctrl = None
         if not minimal_mode:
-            from .controllers import VideoController
+            from .controllers.video_controller import VideoController
             video_ctrl = VideoController(pepper_ip)
         
         # Optional: Tablet
@@ -103,13 +166,7 @@ def run():
         dances = {}
         if not minimal_mode:
             logger.info("Loading dances...")
-            from .dances import WaveDance, SpecialDance, RobotDance, MoonwalkDance
-            dances = {
-                'wave': WaveDance(pepper_conn.motion, pepper_conn.posture),
-                'special': SpecialDance(pepper_conn.motion, pepper_conn.posture),
-                'robot': RobotDance(pepper_conn.motion, pepper_conn.posture),
-                'moonwalk': MoonwalkDance(pepper_conn.motion, pepper_conn.posture)
-            }
+            dances = _build_dances(pepper_conn)
         
         # Optional: Video server
         video_server = None
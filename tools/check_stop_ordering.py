@@ -0,0 +1,176 @@
+#!/usr/bin/env python
+"""
+Stop-Ordering Check
+===================
+Drives BaseController against a fake ALMotion whose moveToward is slow,
+and calls stop() / emergency_stop() while a velocity command is in
+flight. The robot must always end up stopped: the last call to reach
+the fake has to be stopMove/killMove, never a stale moveToward.
+
+The threaded rounds tick move_continuous() on one thread (the Qt timer)
+while another thread (e.g. the voice commander) calls stop(), so the stop
+can land mid-tick. After stop() returns, at most the one moveToward that
+was already in flight may reach the robot, and it must be followed by a
+stop.
+
+Exits non-zero on failure, so it can be used as a regression check.
+
+Usage:
+    python tools/check_stop_ordering.py
+    python tools/check_stop_ordering.py --rounds 50
+"""
+
+import argparse
+import os
+import sys
+import threading
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from test_controller.controllers.base_controller import BaseController  # noqa: E402
+
+MOVE_TOWARD_DELAY = 0.05  # Seconds a fake moveToward takes to reach the robot
+
+
+class SlowMotion:
+    """Fake ALMotion: records each call when it *lands* on the robot."""
+
+    def __init__(self, delay=MOVE_TOWARD_DELAY):
+        self.calls = []
+        self._delay = delay
+        self._lock = threading.Lock()
+
+    def _record(self, name):
+        with self._lock:
+            self.calls.append(name)
+
+    def moveToward(self, x, y, theta):
+        # The request is on the wire; a stop sent meanwhile lands first
+        if self._delay:
+            time.sleep(self._delay)
+        self._record('moveToward')
+
+    def moveTo(self, x, y, theta):
+        self._record('moveTo')
+
+    def stopMove(self):
+        self._record('stopMove')
+
+    def killMove(self):
+        self._record('killMove')
+
+
+def run_round(stop_name, delay):
+    """
+    Start hold-to-move, then stop it `delay` seconds later.
+
+    Returns:
+        Error message, or None if the robot ended up stopped.
+    """
+    motion = SlowMotion()
+    base = BaseController(motion)
+    try:
+        base.set_continuous_velocity('x', 1.0)
+        base.move_continuous()  # Hands a moveToward to the worker
+
+        time.sleep(delay)
+        getattr(base, stop_name)()
+
+        # The tick keeps running after the stop, as the GUI timer would
+        for _ in range(3):
+            base.move_continuous()
+
+        time.sleep(MOVE_TOWARD_DELAY * 4)  # Let in-flight RPCs land
+        calls = list(motion.calls)
+    finally:
+        base.cleanup()
+
+    if 'moveToward' not in calls:
+        return None  # Stopped before anything was sent; nothing to overtake
+
+    last_move = len(calls) - 1 - calls[::-1].index('moveToward')
+    if not any(c in ('stopMove', 'killMove') for c in calls[last_move + 1:]):
+        return f"{stop_name}() overtaken by moveToward: {calls}"
+    return None
+
+
+def run_threaded_round(stop_name, delay):
+    """
+    Tick hold-to-move on its own thread and stop it from another one.
+
+    Returns:
+        Error message, or None if the stop held.
+    """
+    motion = SlowMotion(delay=0.0)
+    base = BaseController(motion)
+    ticking = threading.Event()
+    ticking.set()
+
+    def tick_loop():
+        while ticking.is_set():
+            base.move_continuous()
+
+    ticker = threading.Thread(target=tick_loop, name="Ticker")
+    try:
+        base.set_continuous_velocity('x', 1.0)
+        ticker.start()
+        time.sleep(delay)
+
+        def stop_and_mark():
+            getattr(base, stop_name)()
+            motion._record('STOP')  # Everything after this landed post-stop
+
+        stopper = threading.Thread(target=stop_and_mark, name="Stopper")
+        stopper.start()
+        stopper.join()
+
+        time.sleep(0.5)  # Long enough for a resurrected ramp to re-send
+        ticking.clear()
+        ticker.join()
+        time.sleep(0.05)
+        calls = list(motion.calls)
+    finally:
+        ticking.clear()
+        base.cleanup()
+
+    after = calls[calls.index('STOP') + 1:]
+    moves = after.count('moveToward')
+    if moves > 1:
+        return f"{stop_name}() from another thread: {moves} moveToward after it"
+    if moves and not any(c in ('stopMove', 'killMove')
+                         for c in after[after.index('moveToward') + 1:]):
+        return f"{stop_name}() from another thread overtaken: {after}"
+    return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check that stops are never overtaken")
+    parser.add_argument('--rounds', type=int, default=10, help="Rounds per stop method")
+    args = parser.parse_args()
+
+    failures = []
+    for stop_name in ('stop', 'emergency_stop'):
+        for i in range(args.rounds):
+            # Sweep the stop across the whole in-flight window
+            delay = MOVE_TOWARD_DELAY * i / max(args.rounds - 1, 1)
+            error = run_round(stop_name, delay)
+            if error:
+                failures.append(error)
+
+            error = run_threaded_round(stop_name, 0.05 + delay)
+            if error:
+                failures.append(error)
+
+    if failures:
+        for error in failures:
+            print(f"❌ {error}")
+        return 1
+
+    print(f"✓ stop() and emergency_stop() held in {4 * args.rounds} rounds")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
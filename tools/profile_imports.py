@@ -0,0 +1,100 @@
+#!/usr/bin/env python
+"""
+Import-Time Profiler
+====================
+Runs the package import under `python -X importtime` in a fresh
+interpreter and reports the slowest modules.
+
+Exits non-zero if the cumulative import time of `test_controller`
+exceeds the budget, so it can be used as a startup-regression check.
+
+Usage:
+    python tools/profile_imports.py
+    python tools/profile_imports.py --budget-ms 500 --top 30
+    python tools/profile_imports.py --statement "import test_controller.gui"
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+DEFAULT_STATEMENT = "import test_controller, test_controller.config"
+DEFAULT_BUDGET_MS = 800
+DEFAULT_TOP = 20
+
+
+def profile(statement):
+    """
+    Run `statement` under -X importtime.
+
+    Returns:
+        List of (self_us, cumulative_us, module_name) tuples.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True
+    )
+
+    entries = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+
+        fields = line[len("import time:"):].split("|")
+        if len(fields) != 3:
+            continue
+
+        try:
+            self_us = int(fields[0])
+            cumulative_us = int(fields[1])
+        except ValueError:
+            continue  # Header row
+
+        entries.append((self_us, cumulative_us, fields[2].strip()))
+
+    if result.returncode != 0:
+        raise RuntimeError(f"Import failed:\n{result.stderr}")
+
+    return entries
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Profile test_controller import time")
+    parser.add_argument('--statement', default=DEFAULT_STATEMENT, help="Code to profile")
+    parser.add_argument('--budget-ms', type=float, default=DEFAULT_BUDGET_MS,
+                        help="Max cumulative ms for test_controller")
+    parser.add_argument('--top', type=int, default=DEFAULT_TOP, help="Rows to show")
+    args = parser.parse_args()
+
+    try:
+        entries = profile(args.statement)
+    except RuntimeError as e:
+        print(f"❌ {e}")
+        return 2
+
+    print(f"{'self ms':>9} {'cum ms':>9}  module")
+    for self_us, cumulative_us, name in sorted(entries, reverse=True)[:args.top]:
+        print(f"{self_us / 1000:9.1f} {cumulative_us / 1000:9.1f}  {name}")
+
+    package_us = max(
+        (cum for _, cum, name in entries if name == "test_controller"),
+        default=0
+    )
+    package_ms = package_us / 1000
+
+    print()
+    if package_ms > args.budget_ms:
+        print(f"❌ test_controller import: {package_ms:.1f} ms (budget {args.budget_ms:.0f} ms)")
+        return 1
+
+    print(f"✓ test_controller import: {package_ms:.1f} ms (budget {args.budget_ms:.0f} ms)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())